@@ -4,12 +4,12 @@ import shutil
 import pathlib
 import re
 import tempfile
+import time
 import urllib.parse
 from typing import Dict, Iterator, List, Match, Optional, Tuple, cast
 
 import aiohttp
 import discord
-import sphinx.util.inventory as sphinx_inv
 from redbot.core import Config, checks, commands, data_manager
 from redbot.core.utils import chat_formatting as chatutils
 
@@ -34,6 +34,8 @@ from .types import (
     RefSpec,
 )
 
+__all__ = ["UNIQUE_ID", "DocRef", "safe_filename"]
+
 UNIQUE_ID = 0x178AC710
 
 
@@ -43,6 +45,9 @@ class DocRef(commands.Cog):
     I need to be able to embed links for this cog to be useful!
     """
 
+    # Seconds to wait before checking a cached inventory's version again.
+    INV_CHECK_COOLDOWN = 60
+
     def __init__(self):
         super().__init__()
         self.conf: Config = Config.get_conf(
@@ -51,15 +56,20 @@ class DocRef(commands.Cog):
         self.conf.register_global(sites={}, inv_metadata={})
         self.conf.register_guild(sites={})
         self.invs_data: Dict[str, InvData] = {}
+        self._inv_last_checked: Dict[str, float] = {}
         self.invs_dir: pathlib.Path = data_manager.cog_data_path(self) / "invs"
         self.invs_dir.mkdir(parents=True, exist_ok=True)
-        self.session: aiohttp.ClientSession = aiohttp.ClientSession()
+        self.session: aiohttp.ClientSession = aiohttp.ClientSession(
+            # Docs sites rarely move hosts, so cache DNS lookups for longer than
+            # aiohttp's 10 second default.
+            connector=aiohttp.TCPConnector(ttl_dns_cache=300)
+        )
 
     @commands.command(aliases=["ref", "rtd", "rtfm"])
     async def docref(self, ctx: commands.Context, sitename: str, *, node_ref: NodeRef):
         """Search for a reference in documentation webpages.
 
-        This will display a list hyperlinks to possible matches for the
+        This will display a list of hyperlinks to possible matches for the
         provided node reference.
 
         `<sitename>` is the name for the documentation webpage. This is set
@@ -262,9 +272,9 @@ class DocRef(commands.Cog):
     async def forceupdate(self, ctx: commands.Context, sitename: str):
         """Force a documentation webpage to be updated.
 
-        Updates are checked for every time you use `[p]docref`. However,
-        the inventory cache isn't actually updated unless we have an old
-        version number.
+        Updates are checked for when you use `[p]docref` (at most once a
+        minute per site). However, the inventory cache isn't actually
+        updated unless we have an old version number.
 
         This command will force the site to be updated irrespective of the
         version number.
@@ -347,7 +357,7 @@ class DocRef(commands.Cog):
         sitename : str
             The user-defined site name.
         guild : Optional[discord.Guild]
-            The guild from who's data the URL is being retreived.
+            The guild from whose data the URL is being retrieved.
 
         Returns
         -------
@@ -375,7 +385,7 @@ class DocRef(commands.Cog):
         sitename
             The user-defined site name.
         guild
-            The guild from who's data is being mutated.
+            The guild whose data is being mutated.
         is_owner
             Whether or not the user doing the action is the bot owner.
 
@@ -384,7 +394,7 @@ class DocRef(commands.Cog):
         InvNotAvailable
             If no site with that name is available in the given scope.
         Forbidden
-            If the user does not have the right privelages to remove the site.
+            If the user does not have the right privileges to remove the site.
 
         """
         url = await self.get_url(sitename, guild)
@@ -392,25 +402,25 @@ class DocRef(commands.Cog):
             raise InvNotAvailable()
 
         if guild is not None:
-            sites = await self.conf.guild(guild).sites()
-            if sitename in sites:
-                del sites[sitename]
-                await self.conf.guild(guild).sites.set(sites)
+            guild_sites = self.conf.guild(guild).sites
+            if await guild_sites.get_raw(sitename, default=None) is not None:
+                await guild_sites.clear_raw(sitename)
                 await self._decref(url)
                 return
 
         if not is_owner:
             raise Forbidden("Only bot owners can delete global sites.")
 
-        async with self.conf.sites() as sites:
-            del sites[sitename]
+        await self.conf.sites.clear_raw(sitename)
         await self._decref(url)
 
     async def update_inv(self, url: str, *, force: bool = False) -> InvData:
         """Update a locally cached inventory.
 
         Unless ``force`` is ``True``, this won't update the cache unless the
-        metadata for the inventory does not match.
+        metadata for the inventory does not match, and the remote metadata
+        won't be checked again within `INV_CHECK_COOLDOWN` seconds of the
+        last check.
 
         Arguments
         ---------
@@ -426,18 +436,23 @@ class DocRef(commands.Cog):
             The up-to-date data for the inventory.
 
         """
+        last_checked = self._inv_last_checked.get(url)
+        if not force and last_checked is not None and url in self.invs_data:
+            if time.monotonic() - last_checked < self.INV_CHECK_COOLDOWN:
+                return self.invs_data[url]
+
         try:
             data = await self.get_inv_from_url(url, force_update=force)
         except AlreadyUpToDate:
-            try:
-                data = self.invs_data[url]
-            except KeyError:
+            data = self.invs_data.get(url)
+            if data is None:
                 path = self._get_inv_path(url)
-                data = self.load_inv_file(path, url)
+                data = await self._load_inv_file_in_executor(path, url)
                 self.invs_data[url] = data
         else:
             self.invs_data[url] = data
 
+        self._inv_last_checked[url] = time.monotonic()
         return data
 
     def _get_inv_path(self, url: str) -> pathlib.Path:
@@ -469,7 +484,7 @@ class DocRef(commands.Cog):
 
         """
         inv_path = await self.download_inv_file(url, force_update=force_update)
-        return self.load_inv_file(inv_path, url)
+        return await self._load_inv_file_in_executor(inv_path, url)
 
     def load_inv_file(self, file_path: pathlib.Path, url: str) -> InvData:
         """Load an inventory file from its filepath.
@@ -483,8 +498,20 @@ class DocRef(commands.Cog):
         inv_data = self._load_inv_file_raw(file_path, url)
         return self._format_raw_inv_data(inv_data)
 
+    async def _load_inv_file_in_executor(
+        self, file_path: pathlib.Path, url: str
+    ) -> InvData:
+        # Large inventories (e.g. Python's) take a while to decompress and
+        # parse, so we don't want to block the event loop whilst doing so.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.load_inv_file, file_path, url)
+
     @staticmethod
     def _load_inv_file_raw(file_path: pathlib.Path, url: str) -> RawInvData:
+        # sphinx pulls in docutils and a good chunk of its own package on import,
+        # so we defer that cost until an inventory actually needs loading.
+        import sphinx.util.inventory as sphinx_inv
+
         with file_path.open("rb") as stream:
             inv_data = sphinx_inv.InventoryFile.load(stream, url, urllib.parse.urljoin)
         return inv_data
@@ -593,12 +620,12 @@ class DocRef(commands.Cog):
             If there is no inventory matching that URL.
 
         """
-        try:
-            raw_metadata: RawInvMetaData = await self.conf.inv_metadata.get_raw(url)
-        except KeyError:
-            raise InvNotAvailable
-        else:
-            return InvMetaData(**raw_metadata)
+        raw_metadata: Optional[RawInvMetaData] = await self.conf.inv_metadata.get_raw(
+            url, default=None
+        )
+        if raw_metadata is None:
+            raise InvNotAvailable()
+        return InvMetaData(**raw_metadata)
 
     async def set_inv_metadata(self, url: str, metadata: InvMetaData) -> None:
         """Set metadata for an inventory.
@@ -731,12 +758,9 @@ class DocRef(commands.Cog):
         await self.set_inv_metadata(url, metadata)
 
     async def _destroy_inv(self, url: str) -> None:
-        async with self.conf.inv_metadata() as inv_metadata:
-            del inv_metadata[url]
-        try:
-            del self.invs_data[url]
-        except KeyError:
-            pass
+        await self.conf.inv_metadata.clear_raw(url)
+        self.invs_data.pop(url, None)
+        self._inv_last_checked.pop(url, None)
         inv_file = self._get_inv_path(url)
         if inv_file.exists():
             inv_file.unlink()
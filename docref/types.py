@@ -146,7 +146,9 @@ class NodeRef:
     REF_PATTERN = re.compile(
         r"(?P<dir1>:[a-z\-]+:)?(?P<dir2>[a-z\-]+:)?`?(?P<refname>.*)`?$"
     )
-    STD_ROLES = ("doc", "label", "term", "cmdoption", "envvar", "opcode", "token")
+    STD_ROLES = frozenset(
+        ("doc", "label", "term", "cmdoption", "envvar", "opcode", "token")
+    )
 
     def __init__(self, refname: str, role: str, lang: Optional[str]):
         self.refname: str = refname.strip()
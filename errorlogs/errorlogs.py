@@ -1,9 +1,8 @@
 """Module for the ErrorLogs cog."""
 import asyncio
-import contextlib
 import re
 import traceback
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Set, Tuple, Union
 
 import discord
 from redbot.core import Config, checks, commands, data_manager
@@ -33,7 +32,7 @@ class ErrorLogs(commands.Cog):
         self.conf = Config.get_conf(self, identifier=UNIQUE_ID, force_registration=True)
         self.conf.register_channel(enabled=False, global_errors=False)
 
-        self._tasks: List[asyncio.Task] = []
+        self._tasks: Set[asyncio.Task] = set()
         super().__init__()
 
     async def red_delete_data_for_user(self, **kwargs):
@@ -108,7 +107,7 @@ class ErrorLogs(commands.Cog):
             LogScrollingMenu.send(ctx, latest_logs, page_size, num_pages)
         )
         task.add_done_callback(self._remove_task)
-        self._tasks.append(task)
+        self._tasks.add(task)
 
     @commands.Cog.listener()
     async def on_command_error(
@@ -180,8 +179,7 @@ class ErrorLogs(commands.Cog):
         self._tasks.clear()
 
     def _remove_task(self, task: asyncio.Task) -> None:
-        with contextlib.suppress(ValueError):
-            self._tasks.remove(task)
+        self._tasks.discard(task)
 
     @staticmethod
     def _get_channels_and_settings(
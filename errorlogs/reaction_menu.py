@@ -88,11 +88,8 @@ class LogScrollingMenu:
         if not self._same_context(payload):
             return
 
-        try:
-            handler = self._handlers[payload.emoji.name]
-        except KeyError:
-            return
-        else:
+        handler = self._handlers.get(payload.emoji.name)
+        if handler is not None:
             await handler(self, payload)
 
     @button("\N{UPWARDS BLACK ARROW}")
@@ -1,5 +1,6 @@
 """Module for the ReactKarma cog."""
 import asyncio
+import heapq
 import logging
 from collections import namedtuple
 
@@ -73,19 +74,21 @@ class ReactKarma(getattr(commands, "Cog", object)):
         elif top < 0:
             reverse = False
             top = -top
-        members_sorted = sorted(
-            await self._get_all_members(ctx.bot), key=lambda x: x.karma, reverse=reverse
+        members = await self._get_all_members(ctx.bot)
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        topten = select(top, members, key=lambda x: x.karma)
+        top = len(topten)
+        place_width = len(str(top)) + 1
+        name_width = max((len(member.name) for member in topten), default=0)
+        karma_width = max((len(str(member.karma)) for member in topten), default=0)
+        highscore = "\n".join(
+            "{}{} | {}".format(
+                str(place).ljust(place_width),
+                member.name.ljust(name_width),
+                str(member.karma).rjust(karma_width),
+            )
+            for place, member in enumerate(topten, start=1)
         )
-        if len(members_sorted) < top:
-            top = len(members_sorted)
-        topten = members_sorted[:top]
-        highscore = ""
-        place = 1
-        for member in topten:
-            highscore += str(place).ljust(len(str(top)) + 1)
-            highscore += "{} | ".format(member.name).ljust(18 - len(str(member.karma)))
-            highscore += str(member.karma) + "\n"
-            place += 1
         if highscore != "":
             for page in pagify(highscore, shorten_by=12):
                 await ctx.send(box(page, lang="py"))
@@ -208,7 +211,7 @@ class ReactKarma(getattr(commands, "Cog", object)):
     async def _is_upvote(self, guild: discord.Guild, emoji):
         """Check if the given emoji is an upvote.
 
-        Returns True if the emoji is the upvote emoji, False f it is the
+        Returns True if the emoji is the upvote emoji, False if it is the
         downvote emoji, and None otherwise.
         """
         upvote = await self.conf.guild(guild).upvote()
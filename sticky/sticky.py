@@ -10,6 +10,8 @@ from redbot.core import Config, checks, commands
 from redbot.core.utils.menus import start_adding_reactions
 from redbot.core.utils.predicates import MessagePredicate, ReactionPredicate
 
+__all__ = ["UNIQUE_ID", "Sticky"]
+
 UNIQUE_ID = 0x6AFE8000
 
 log = logging.getLogger("red.sticky")
@@ -1,12 +1,9 @@
 """StreamRoles - Give roles to streaming users."""
 import asyncio
-import logging
 from redbot.core.bot import Red
 
 from .streamroles import StreamRoles
 
-log = logging.getLogger("red.streamroles")
-
 
 async def setup(bot: Red):
     cog = StreamRoles(bot)
@@ -11,6 +11,8 @@ from redbot.core.utils import chat_formatting as chatutils, menus, predicates
 
 from .types import FilterList
 
+__all__ = ["UNIQUE_ID", "StreamRoles"]
+
 log = logging.getLogger("red.streamroles")
 
 UNIQUE_ID = 0x923476AF
@@ -321,12 +323,7 @@ class StreamRoles(commands.Cog):
         role_id = await self.conf.guild(guild).streamer_role()
         if not role_id:
             return
-        try:
-            role = next(r for r in guild.roles if r.id == role_id)
-        except StopIteration:
-            return
-        else:
-            return role
+        return guild.get_role(role_id)
 
     async def get_alerts_channel(
         self, guild: discord.Guild
@@ -354,6 +351,7 @@ class StreamRoles(commands.Cog):
         member: discord.Member,
         role: Optional[discord.Role] = None,
         alerts_channel: Optional[discord.TextChannel] = _alerts_channel_sentinel,
+        game_whitelist: Optional[List[str]] = None,
     ) -> None:
         role = role or await self.get_streamer_role(member.guild)
         if role is None:
@@ -375,8 +373,9 @@ class StreamRoles(commands.Cog):
         has_role = role in member.roles
         if activity is not None and await self._is_allowed(member):
             game = activity.game
-            games = await self.conf.guild(member.guild).game_whitelist()
-            if not games or game in games:
+            if game_whitelist is None:
+                game_whitelist = await self.conf.guild(member.guild).game_whitelist()
+            if not game_whitelist or game in game_whitelist:
                 if not has_role:
                     log.debug("Adding streamrole %s to member %s", role.id, member.id)
                     await member.add_roles(role)
@@ -412,8 +411,11 @@ class StreamRoles(commands.Cog):
                         reason=f"Removing streamrole after {role} role was blacklisted",
                     )
         else:
+            game_whitelist = await self.conf.guild(role.guild).game_whitelist()
             for member in role.members:
-                await self._update_member(member, streamer_role, alerts_channel)
+                await self._update_member(
+                    member, streamer_role, alerts_channel, game_whitelist
+                )
 
     async def _update_guild(self, guild: discord.Guild) -> None:
         streamer_role = await self.get_streamer_role(guild)
@@ -421,9 +423,12 @@ class StreamRoles(commands.Cog):
             return
 
         alerts_channel = await self.get_alerts_channel(guild)
+        game_whitelist = await self.conf.guild(guild).game_whitelist()
 
         for member in guild.members:
-            await self._update_member(member, streamer_role, alerts_channel)
+            await self._update_member(
+                member, streamer_role, alerts_channel, game_whitelist
+            )
 
     async def _post_alert(
         self,
@@ -456,15 +461,7 @@ class StreamRoles(commands.Cog):
             return
         await conf_group.clear_raw(str(channel.id))
 
-        msg: Optional[discord.Message] = discord.utils.get(
-            getattr(self.bot, "cached_messages", ()), id=msg_id
-        )
-        if msg is None:
-            try:
-                msg = await channel.fetch_message(msg_id)
-            except discord.NotFound:
-                return
-
+        msg = channel.get_partial_message(msg_id)
         with contextlib.suppress(discord.NotFound):
             await msg.delete()
 
@@ -495,15 +492,15 @@ class StreamRoles(commands.Cog):
     async def _is_whitelisted(self, member: discord.Member) -> bool:
         if await self.conf.member(member).whitelisted():
             return True
-        for role in member.roles:
-            if await self.conf.role(role).whitelisted():
-                return True
-        return False
+        all_role_data = await self.conf.all_roles()
+        return any(
+            all_role_data.get(role.id, {}).get("whitelisted") for role in member.roles
+        )
 
     async def _is_blacklisted(self, member: discord.Member) -> bool:
         if await self.conf.member(member).blacklisted():
             return True
-        for role in member.roles:
-            if await self.conf.role(role).blacklisted():
-                return True
-        return False
+        all_role_data = await self.conf.all_roles()
+        return any(
+            all_role_data.get(role.id, {}).get("blacklisted") for role in member.roles
+        )
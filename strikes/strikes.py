@@ -22,6 +22,8 @@ except ImportError:
         "This command requires the `downloader` cog to be loaded."
     )
 
+__all__ = ["UNIQUE_ID", "Strikes"]
+
 UNIQUE_ID = 0x134087DE
 
 _CASETYPE = {
@@ -244,7 +246,7 @@ class Strikes(commands.Cog):
 
         `[num_days]` is the number of past days of strikes to display.
         Defaults to 30. When 0, all strikes from the beginning of time
-        will be counted shown.
+        will be shown.
 
         """
         if num_days < 0:
@@ -339,6 +341,7 @@ class Strikes(commands.Cog):
                     "strikes for."
                 )
             )
+            return
         sort_by = sort_by.lower()
         if sort_by not in ("count", "date"):
             await ctx.send(
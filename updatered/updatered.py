@@ -13,6 +13,8 @@ from typing import ClassVar, Iterable, List, Optional, Pattern, Tuple
 import discord
 from redbot.core import checks, commands
 
+__all__ = ["UpdateRed"]
+
 log = logging.getLogger("red.updatered")
 
 
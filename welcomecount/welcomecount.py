@@ -1,6 +1,7 @@
 """Module for the WelcomeCount Cog."""
+import contextlib
 import datetime
-from typing import List, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import discord
 from redbot.core import Config, checks, commands
@@ -32,9 +33,6 @@ class WelcomeCount(commands.Cog):
             delete_last_message=True,
             welcome_msg=_DEFAULT_WELCOME,
         )
-        self.conf.register_channel(
-            enabled=False, last_message=None, welcome_msg=_DEFAULT_WELCOME
-        )
         self.conf.register_guild(count=0, day=None, join_role=None)
 
     @checks.admin_or_permissions(manage_guild=True)
@@ -163,40 +161,35 @@ class WelcomeCount(commands.Cog):
             await server_settings.day.set(str(today))
             await server_settings.count.set(1)
 
-        welcome_channels: List[discord.TextChannel] = []
-        # noinspection PyUnusedLocal
-        channel: discord.TextChannel
+        # Read every channel's settings in one go, rather than once per
+        # channel in the guild.
+        all_channel_data = await self.conf.all_channels()
+        welcome_channels: List[Tuple[discord.TextChannel, Dict[str, Any]]] = []
         for channel in guild.channels:
-            if await self.conf.channel(channel).enabled():
-                welcome_channels.append(channel)
-
-        for channel in welcome_channels:
-            channel_settings = self.conf.channel(channel)
-
-            delete_last: bool = await channel_settings.delete_last_message()
-            if delete_last and not new_day:
-                last_message: int = await channel_settings.last_message()
-                try:
-                    last_message: discord.Message = await channel.fetch_message(
-                        last_message
-                    )
-                except discord.HTTPException:
-                    # Perhaps the message was deleted
-                    pass
-                else:
-                    await last_message.delete()
-            count: int = await server_settings.count()
-            params = {
-                "mention": member.mention,
-                "username": member.display_name,
-                "server": guild.name,
-                "count": count,
-                "plural": "" if count == 1 else "s",
-                "total": guild.member_count,
-            }
-            welcome: str = await channel_settings.welcome_msg()
+            channel_data = all_channel_data.get(channel.id)
+            if channel_data is not None and channel_data["enabled"]:
+                welcome_channels.append((channel, channel_data))
+
+        count: int = await server_settings.count()
+        params = {
+            "mention": member.mention,
+            "username": member.display_name,
+            "server": guild.name,
+            "count": count,
+            "plural": "" if count == 1 else "s",
+            "total": guild.member_count,
+        }
+        for channel, channel_data in welcome_channels:
+            if channel_data["delete_last_message"] and not new_day:
+                last_message_id: Optional[int] = channel_data["last_message"]
+                if last_message_id is not None:
+                    last_message = channel.get_partial_message(last_message_id)
+                    with contextlib.suppress(discord.NotFound):
+                        # Perhaps the message was already deleted
+                        await last_message.delete()
+            welcome: str = channel_data["welcome_msg"]
             msg: discord.Message = await channel.send(welcome.format(**params))
-            await channel_settings.last_message.set(msg.id)
+            await self.conf.channel(channel).last_message.set(msg.id)
 
     # Events
 
@@ -212,13 +205,8 @@ class WelcomeCount(commands.Cog):
         if join_role_id is None:
             return
 
-        before_roles = frozenset(before.roles)
-        after_roles = frozenset(after.roles)
-        try:
-            added_role = next(iter(after_roles - before_roles))
-        except StopIteration:
-            # A role wasn't added
-            return
-
-        if added_role.id == join_role_id:
+        # Only welcome the member when the join role itself was just added
+        had_role = any(role.id == join_role_id for role in before.roles)
+        has_role = any(role.id == join_role_id for role in after.roles)
+        if has_role and not had_role:
             await self.send_welcome_message(after)